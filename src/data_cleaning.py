@@ -3,12 +3,45 @@ Módulo para limpieza avanzada y sistemática de datos de texto.
 Implementa múltiples niveles de limpieza con seguimiento de transformaciones.
 """
 
-from typing import Dict, List, Any
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from collections import Counter
+import functools
+import multiprocessing
+from multiprocessing.pool import Pool
 import re
 import nltk
+import pandas as pd
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer, PorterStemmer
-from nltk.tokenize import word_tokenize
+
+try:
+    # Autómata Aho-Corasick en C para las stopwords de varias palabras
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _es_caracter_palabra(caracter: str) -> bool:
+    """
+    Indica si un carácter cuenta como parte de una palabra, igual que \\w en re.
+
+    Args:
+        caracter (str): Carácter a comprobar
+
+    Returns:
+        bool: True si es alfanumérico o guion bajo
+    """
+    return caracter.isalnum() or caracter == "_"
 
 
 class DataCleaner:
@@ -17,25 +50,149 @@ class DataCleaner:
     Implementa múltiples niveles de limpieza con seguimiento de transformaciones.
     """
 
-    def __init__(self, idioma: str = "english") -> None:
+    def __init__(
+        self,
+        idioma: str = "english",
+        palabras_vacias_extra: Iterable[str] = (),
+        modelo_spacy: str = "en_core_web_sm",
+    ) -> None:
         self.idioma: str = idioma
-        self.lemmatizador: WordNetLemmatizer = WordNetLemmatizer()
-        self.stemmer: PorterStemmer = PorterStemmer()
-        self.palabras_vacias: set[str] = set(stopwords.words(idioma))  # type: ignore
+        self.modelo_spacy: str = modelo_spacy
+        self.palabras_vacias_extra: Tuple[str, ...] = tuple(
+            " ".join(entrada.lower().split()) for entrada in palabras_vacias_extra
+        )
         self.historial_limpieza: Dict[str, Any] = {}
 
-        # Patrones de expresiones regulares para limpieza
-        self.patrones_limpieza: Dict[str, str] = {
-            "urls": r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+",
-            "emails": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
-            "menciones": r"@\w+",
-            "hashtags": r"#\w+",
-            "numeros": r"\b\d+\b",
-            "puntuacion_multiple": r"[^\w\s]{2,}",
-            "espacios_multiples": r"\s{2,}",
-            "caracteres_especiales": r"[^\w\s\-\'.,!?;:]",
+        # Pool de procesos reutilizado entre llamadas por lotes (se crea al usarse)
+        self._pool: Optional[Pool] = None
+        self._pool_procesos: Optional[int] = None
+
+        # Patrones de expresiones regulares para limpieza (compilados una sola vez)
+        self.patrones_limpieza: Dict[str, re.Pattern[str]] = {
+            "urls": re.compile(
+                r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]"
+                r"|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
+            ),
+            "emails": re.compile(
+                r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
+            ),
+            "menciones": re.compile(r"@\w+"),
+            "hashtags": re.compile(r"#\w+"),
+            "numeros": re.compile(r"\b\d+\b"),
+            "puntuacion_multiple": re.compile(r"[^\w\s]{2,}"),
+            "espacios_multiples": re.compile(r"\s{2,}"),
+            "caracteres_especiales": re.compile(r"[^\w\s\-\'.,!?;:]"),
         }
 
+        # Patrones fusionados: una sola pasada por nivel de limpieza
+        self._basic_re: re.Pattern[str] = re.compile(
+            "|".join(
+                f"(?:{self.patrones_limpieza[nombre].pattern})"
+                for nombre in ["urls", "emails", "menciones", "hashtags"]
+            )
+        )
+        # Versión para texto sin pasar a minúsculas (lematizar_con_spacy), de
+        # modo que "HTTPS://..." también se elimine
+        self._basic_ci_re: re.Pattern[str] = re.compile(
+            self._basic_re.pattern, re.IGNORECASE
+        )
+        patrones: Dict[str, re.Pattern[str]] = self.patrones_limpieza
+        self._intermedio_re: re.Pattern[str] = re.compile(
+            f"(?P<puntuacion_multiple>{patrones['puntuacion_multiple'].pattern})"
+            f"|{patrones['caracteres_especiales'].pattern}"
+        )
+        self._ws_re: re.Pattern[str] = self.patrones_limpieza["espacios_multiples"]
+        self._espacios_re: re.Pattern[str] = re.compile(r"\s+")
+
+        # Contracciones comunes en inglés; las más largas primero en la
+        # alternancia para que "can't" tenga prioridad sobre "n't"
+        self._contractions: Dict[str, str] = {
+            "can't": "cannot",
+            "won't": "will not",
+            "n't": " not",
+            "'re": " are",
+            "'ve": " have",
+            "'ll": " will",
+            "'d": " would",
+            "'m": " am",
+            "it's": "it is",
+            "that's": "that is",
+            "what's": "what is",
+        }
+        self._contraction_re: re.Pattern[str] = re.compile(
+            "|".join(
+                re.escape(contraccion)
+                for contraccion in sorted(self._contractions, key=len, reverse=True)
+            )
+        )
+
+        # Stopwords de varias palabras. Con pyahocorasick se buscan todas en una
+        # sola pasada lineal sin importar cuántas haya; sin él se usa una
+        # alternancia de re (las más largas primero), cuyo costo crece con el
+        # número de frases porque re prueba cada rama en cada posición
+        frases_vacias: List[str] = sorted(
+            (entrada for entrada in self.palabras_vacias_extra if " " in entrada),
+            key=len,
+            reverse=True,
+        )
+        self._automata_frases: Optional[Any] = None
+        self._frases_vacias_re: Optional[re.Pattern[str]] = None
+        if frases_vacias and ahocorasick is not None:
+            self._automata_frases = ahocorasick.Automaton()
+            for frase in frases_vacias:
+                self._automata_frases.add_word(frase, len(frase))
+            self._automata_frases.make_automaton()
+        elif frases_vacias:
+            self._frases_vacias_re = re.compile(
+                r"(?<!\w)(?:"
+                + "|".join(
+                    r"\s+".join(re.escape(palabra) for palabra in frase.split())
+                    for frase in frases_vacias
+                )
+                + r")(?!\w)",
+                re.IGNORECASE,
+            )
+
+        # Tokens: secuencias de 3 o más letras (equivale a isalpha() y len > 2)
+        self._tok_re: re.Pattern[str] = re.compile(r"[^\W\d_]{3,}")
+
+    # Los recursos de NLTK se cargan en el primer uso: quien solo aplica los
+    # niveles 1 y 2 no paga la carga de WordNet ni de las stopwords
+
+    @functools.cached_property
+    def lemmatizador(self) -> WordNetLemmatizer:
+        """Lematizador de WordNet, creado en el primer uso."""
+        return WordNetLemmatizer()
+
+    @functools.cached_property
+    def stemmer(self) -> PorterStemmer:
+        """Stemmer de Porter, creado en el primer uso."""
+        return PorterStemmer()
+
+    @functools.cached_property
+    def palabras_vacias(self) -> FrozenSet[str]:
+        """Stopwords del idioma más las palabras de palabras_vacias_extra."""
+        return frozenset(stopwords.words(self.idioma)).union(  # type: ignore
+            entrada for entrada in self.palabras_vacias_extra if " " not in entrada
+        )
+
+    @functools.cached_property
+    def _nlp(self) -> Any:
+        """Pipeline de spaCy sin parser ni NER, cargado solo si se usa."""
+        import spacy
+
+        return spacy.load(self.modelo_spacy, disable=["parser", "ner"])
+
+    @functools.cached_property
+    def _lem(self) -> Callable[[str], str]:
+        # Caché LRU por token: la distribución de palabras es de tipo Zipf, por
+        # lo que la mayoría de las llamadas repiten tokens ya normalizados
+        return functools.lru_cache(maxsize=200_000)(self.lemmatizador.lemmatize)
+
+    @functools.cached_property
+    def _stem(self) -> Callable[[str], str]:
+        return functools.lru_cache(maxsize=200_000)(self.stemmer.stem)
+
     def limpiar_nivel_basico(self, texto: str) -> str:
         """
         Nivel 1: Limpieza básica de formato y caracteres especiales.
@@ -49,15 +206,11 @@ class DataCleaner:
         # Convertir a minúsculas
         texto_limpio: str = texto.lower()
 
-        # Eliminar URLs, emails, menciones
-        for patron_nombre, patron in self.patrones_limpieza.items():
-            if patron_nombre in ["urls", "emails", "menciones", "hashtags"]:
-                texto_limpio = re.sub(patron, "", texto_limpio)
+        # Eliminar URLs, emails, menciones y hashtags en una sola pasada
+        texto_limpio = self._basic_re.sub("", texto_limpio)
 
         # Normalizar espacios en blanco
-        texto_limpio = re.sub(
-            self.patrones_limpieza["espacios_multiples"], " ", texto_limpio
-        )
+        texto_limpio = self._ws_re.sub(" ", texto_limpio)
 
         return texto_limpio.strip()
 
@@ -73,41 +226,64 @@ class DataCleaner:
         """
         texto_limpio: str = texto
 
-        # Manejar contracciones comunes en inglés
-        contracciones: Dict[str, str] = {
-            "can't": "cannot",
-            "won't": "will not",
-            "n't": " not",
-            "'re": " are",
-            "'ve": " have",
-            "'ll": " will",
-            "'d": " would",
-            "'m": " am",
-            "it's": "it is",
-            "that's": "that is",
-            "what's": "what is",
-        }
-
-        for contraccion, expansion in contracciones.items():
-            texto_limpio = texto_limpio.replace(contraccion, expansion)
-
-        # Eliminar puntuación múltiple pero preservar puntos y comas importantes
-        texto_limpio = re.sub(
-            self.patrones_limpieza["puntuacion_multiple"], "", texto_limpio
+        # Expandir contracciones comunes en inglés en una sola pasada
+        texto_limpio = self._contraction_re.sub(
+            lambda m: self._contractions[m.group(0)], texto_limpio
         )
 
-        # Eliminar caracteres especiales pero mantener apóstrofes y guiones
-        texto_limpio = re.sub(
-            self.patrones_limpieza["caracteres_especiales"], " ", texto_limpio
+        # Eliminar puntuación múltiple y reemplazar caracteres especiales por
+        # espacios (manteniendo apóstrofes y guiones) en una sola pasada
+        texto_limpio = self._intermedio_re.sub(
+            lambda m: "" if m.group("puntuacion_multiple") is not None else " ",
+            texto_limpio,
         )
 
         # Normalizar espacios nuevamente
-        texto_limpio = re.sub(
-            self.patrones_limpieza["espacios_multiples"], " ", texto_limpio
-        )
+        texto_limpio = self._ws_re.sub(" ", texto_limpio)
 
         return texto_limpio.strip()
 
+    def limpiar(self, texto: str) -> str:
+        """
+        Niveles 1 y 2 fusionados: cinco pasadas por documento en lugar de diez.
+
+        El resultado equivale a limpiar_nivel_intermedio(limpiar_nivel_basico(texto))
+        salvo que todo espacio en blanco queda normalizado a un único espacio con
+        una sola sustitución final.
+
+        Args:
+            texto (str): Texto original
+
+        Returns:
+            str: Texto con limpieza básica e intermedia aplicada
+        """
+        texto_limpio: str = self._basic_re.sub("", texto.lower())
+        texto_limpio = self._contraction_re.sub(
+            lambda m: self._contractions[m.group(0)], texto_limpio
+        )
+        texto_limpio = self._intermedio_re.sub(
+            lambda m: "" if m.group("puntuacion_multiple") is not None else " ",
+            texto_limpio,
+        )
+        return self._espacios_re.sub(" ", texto_limpio).strip()
+
+    def limpiar_serie(self, serie: pd.Series) -> pd.Series:
+        """
+        Aplica limpiar() a cada texto de una serie, fila por fila.
+
+        No es una limpieza vectorizada: es un map de Python sobre la serie. Los
+        valores faltantes (None, NaN, pd.NA) se conservan como en los métodos
+        .str de pandas, y el resultado mantiene el dtype de la serie (por
+        ejemplo string[pyarrow]).
+
+        Args:
+            serie (pd.Series): Serie de textos originales
+
+        Returns:
+            pd.Series: Serie con limpieza básica e intermedia aplicada
+        """
+        return serie.map(self.limpiar, na_action="ignore").astype(serie.dtype)
+
     def tokenizar_y_filtrar(self, texto: str) -> List[str]:
         """
         Nivel 3: Tokenización y filtrado avanzado.
@@ -118,23 +294,65 @@ class DataCleaner:
         Returns:
             List[str]: Lista de tokens filtrados
         """
-        # Tokenizar usando NLTK
-        tokens: List[str] = word_tokenize(texto)
+        # Eliminar las stopwords de varias palabras antes de tokenizar
+        texto_minusculas: str = self._eliminar_frases_vacias(texto.lower())
+
+        # Tokenizar con una sola pasada de regex: el patrón ya garantiza
+        # palabras alfabéticas de más de 2 caracteres
+        palabras_vacias: FrozenSet[str] = self.palabras_vacias
+        return [
+            token
+            for token in self._tok_re.findall(texto_minusculas)
+            if token not in palabras_vacias
+        ]
+
+    def _eliminar_frases_vacias(self, texto: str) -> str:
+        """
+        Elimina las stopwords de varias palabras de un texto, sin distinguir
+        mayúsculas de minúsculas.
 
-        # Filtros aplicados secuencialmente
-        tokens_filtrados: List[str] = []
+        Solo se eliminan coincidencias de frases completas: "web browser" no
+        se elimina dentro de "web browsers".
 
-        for token in tokens:
-            # Solo palabras alfabéticas de más de 2 caracteres
-            if (
-                token.isalpha()
-                and len(token) > 2
-                and token not in self.palabras_vacias
-                and not token.isdigit()
+        Args:
+            texto (str): Texto en el que buscar las frases
+
+        Returns:
+            str: Texto sin las frases de palabras_vacias_extra
+        """
+        if self._frases_vacias_re is not None:
+            return self._frases_vacias_re.sub(" ", texto)
+        if self._automata_frases is None:
+            return texto
+
+        # Las frases se guardan con un solo espacio entre palabras
+        texto = " ".join(texto.split())
+        # Las frases se guardan en minúsculas; si lower() cambia la longitud
+        # (p. ej. "İ") los índices no valdrían para el original y se pierde
+        # la capitalización de ese texto
+        texto_minusculas: str = texto.lower()
+        if len(texto_minusculas) != len(texto):
+            texto = texto_minusculas
+
+        tramos: List[Tuple[int, int]] = []
+        for fin, longitud in self._automata_frases.iter(texto_minusculas):
+            inicio: int = fin - longitud + 1
+            if (inicio == 0 or not _es_caracter_palabra(texto[inicio - 1])) and (
+                fin + 1 == len(texto) or not _es_caracter_palabra(texto[fin + 1])
             ):
-                tokens_filtrados.append(token)
+                tramos.append((inicio, fin + 1))
 
-        return tokens_filtrados
+        # Como la alternancia de re: la coincidencia más a la izquierda y, en
+        # la misma posición, la más larga, sin solapamientos
+        partes: List[str] = []
+        posicion: int = 0
+        for inicio, fin in sorted(tramos, key=lambda tramo: (tramo[0], -tramo[1])):
+            if inicio >= posicion:
+                partes.append(texto[posicion:inicio])
+                posicion = fin
+        partes.append(texto[posicion:])
+
+        return " ".join(partes)
 
     def aplicar_normalizacion_morfologica(
         self, tokens: List[str], metodo: str = "lemmatization"
@@ -150,12 +368,87 @@ class DataCleaner:
             List[str]: Tokens normalizados morfológicamente
         """
         if metodo == "lemmatization":
-            return [self.lemmatizador.lemmatize(token) for token in tokens]
+            return [self._lem(token) for token in tokens]
         elif metodo == "stemming":
-            return [self.stemmer.stem(token) for token in tokens] # type: ignore
+            return [self._stem(token) for token in tokens]
         else:
             raise ValueError("Método debe ser 'lemmatization' o 'stemming'")
 
+    def lematizar_con_spacy(
+        self, textos: List[str], batch_size: int = 1000, n_process: int = 1
+    ) -> List[List[str]]:
+        """
+        Niveles 3 y 4 fusionados con spaCy: tokenización, filtrado y lematización
+        según la categoría gramatical, procesando los documentos por lotes.
+
+        A diferencia de aplicar_normalizacion_morfologica, que lematiza cada
+        token como sustantivo, spaCy usa el etiquetado POS de cada documento.
+        Por eso los textos le llegan sin pasar a minúsculas ni quitar la
+        puntuación (solo se eliminan URLs, emails, menciones y hashtags), y
+        son los lemas los que se pasan a minúsculas.
+
+        Args:
+            textos (List[str]): Documentos originales
+            batch_size (int): Documentos procesados por lote en nlp.pipe
+            n_process (int): Procesos de spaCy (-1 para usar todos los núcleos)
+
+        Returns:
+            List[List[str]]: Lemas filtrados de cada documento, en el mismo orden
+        """
+        palabras_vacias: FrozenSet[str] = self.palabras_vacias
+
+        # Mayúsculas y puntuación ayudan al etiquetado POS: solo se quitan los
+        # elementos sin contenido lingüístico (y las frases vacías)
+        textos_limpios: Iterable[str] = (
+            self._basic_ci_re.sub("", texto) for texto in textos
+        )
+        if self.palabras_vacias_extra:
+            textos_limpios = (
+                self._eliminar_frases_vacias(texto) for texto in textos_limpios
+            )
+
+        documentos = self._nlp.pipe(
+            textos_limpios, batch_size=batch_size, n_process=n_process
+        )
+        return [
+            [
+                token.lemma_.lower()
+                for token in documento
+                if token.is_alpha
+                and len(token) > 2
+                and token.lower_ not in palabras_vacias
+            ]
+            for documento in documentos
+        ]
+
+    def obtener_tokens(
+        self,
+        texto: str,
+        incluir_normalizacion: bool = True,
+        metodo_normalizacion: str = "lemmatization",
+    ) -> List[str]:
+        """
+        Aplica todos los niveles de limpieza y devuelve solo los tokens finales.
+
+        No construye los textos intermedios ni las estadísticas de
+        proceso_limpieza_completa (para métricas, usar
+        utils.calcular_metricas_texto sobre el resultado).
+
+        Args:
+            texto (str): Texto original
+            incluir_normalizacion (bool): Si aplicar normalización morfológica
+            metodo_normalizacion (str): Método de normalización a usar
+
+        Returns:
+            List[str]: Tokens finales del documento
+        """
+        tokens: List[str] = self.tokenizar_y_filtrar(self.limpiar(texto))
+        if incluir_normalizacion:
+            tokens = self.aplicar_normalizacion_morfologica(
+                tokens, metodo_normalizacion
+            )
+        return tokens
+
     def proceso_limpieza_completa(
         self,
         texto: str,
@@ -220,6 +513,148 @@ class DataCleaner:
 
         return resultados
 
+    def proceso_limpieza_batch(
+        self,
+        textos: List[str],
+        incluir_normalizacion: bool = True,
+        metodo_normalizacion: str = "lemmatization",
+        n_workers: Optional[int] = None,
+        chunksize: int = 64,
+        incluir_estadisticas: bool = False,
+    ) -> List[Union[Dict[str, Any], List[str]]]:
+        """
+        Ejecuta el proceso completo de limpieza sobre varios documentos en paralelo.
+
+        Cada proceso trabajador crea su propio DataCleaner una sola vez al
+        iniciar, de modo que stopwords y lematizador no se cargan por documento.
+        El pool se mantiene abierto entre llamadas hasta llamar a close() (o al
+        salir de un bloque with).
+
+        Args:
+            textos (List[str]): Documentos originales
+            incluir_normalizacion (bool): Si aplicar normalización morfológica
+            metodo_normalizacion (str): Método de normalización a usar
+            n_workers (Optional[int]): Procesos a usar (por defecto os.cpu_count())
+            chunksize (int): Documentos enviados a cada trabajador por envío
+            incluir_estadisticas (bool): Si devolver las estadísticas de cada nivel
+                (proceso_limpieza_completa) en lugar de solo los tokens finales
+                (obtener_tokens)
+
+        Returns:
+            List[Union[Dict[str, Any], List[str]]]: Resultado por documento, en el
+            mismo orden que textos
+        """
+        procesar: Callable[..., Union[Dict[str, Any], List[str]]] = (
+            _limpiar_documento if incluir_estadisticas else _tokens_documento
+        )
+        limpiar = functools.partial(
+            procesar,
+            incluir_normalizacion=incluir_normalizacion,
+            metodo_normalizacion=metodo_normalizacion,
+        )
+
+        pool: Pool = self._obtener_pool(n_workers)
+        return list(pool.imap(limpiar, textos, chunksize=chunksize))
+
+    def contar_vocabulario(
+        self,
+        textos: List[str],
+        incluir_normalizacion: bool = True,
+        metodo_normalizacion: str = "lemmatization",
+        n_workers: Optional[int] = None,
+        chunksize: int = 64,
+    ) -> Counter[str]:
+        """
+        Calcula las frecuencias agregadas de los tokens finales de varios documentos.
+
+        No construye las estadísticas por documento de proceso_limpieza_completa:
+        los trabajadores devuelven solo los tokens y se acumulan en un Counter.
+
+        Args:
+            textos (List[str]): Documentos originales
+            incluir_normalizacion (bool): Si aplicar normalización morfológica
+            metodo_normalizacion (str): Método de normalización a usar
+            n_workers (Optional[int]): Procesos a usar (por defecto os.cpu_count())
+            chunksize (int): Documentos enviados a cada trabajador por envío
+
+        Returns:
+            Counter[str]: Frecuencia de cada token en todo el conjunto de textos
+        """
+        tokenizar = functools.partial(
+            _tokens_documento,
+            incluir_normalizacion=incluir_normalizacion,
+            metodo_normalizacion=metodo_normalizacion,
+        )
+
+        vocabulario: Counter[str] = Counter()
+        pool: Pool = self._obtener_pool(n_workers)
+        # El orden no importa para el conteo agregado
+        for tokens in pool.imap_unordered(tokenizar, textos, chunksize=chunksize):
+            vocabulario.update(tokens)
+
+        return vocabulario
+
+    def _obtener_pool(self, n_workers: Optional[int]) -> Pool:
+        """
+        Devuelve el pool de procesos del limpiador, creándolo en el primer uso.
+
+        El pool se reutiliza entre llamadas, de modo que los trabajadores (y sus
+        stopwords y lematizador) se crean una sola vez y no en cada lote. Si se
+        pide otro número de procesos, el pool anterior se cierra y se recrea.
+
+        Args:
+            n_workers (Optional[int]): Procesos a usar (por defecto os.cpu_count())
+
+        Returns:
+            Pool: Pool cuyos trabajadores replican este limpiador
+        """
+        if self._pool is not None and self._pool_procesos != n_workers:
+            self.close()
+
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(
+                processes=n_workers,
+                initializer=_inicializar_trabajador,
+                initargs=(self.idioma, self.palabras_vacias_extra),
+            )
+            self._pool_procesos = n_workers
+
+        return self._pool
+
+    def close(self) -> None:
+        """
+        Cierra el pool de procesos de las llamadas por lotes, si existe.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self._pool_procesos = None
+
+    def __enter__(self) -> "DataCleaner":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Estado para pickle sin los objetos que no se pueden serializar.
+
+        Las cachés LRU de _lem/_stem y el pipeline de spaCy se descartan y se
+        vuelven a crear en el primer uso tras deserializar. El pool de procesos
+        no se copia: la copia crea el suyo en su primera llamada por lotes.
+
+        Returns:
+            Dict[str, Any]: Atributos serializables del limpiador
+        """
+        estado: Dict[str, Any] = self.__dict__.copy()
+        for atributo in ("_lem", "_stem", "_nlp"):
+            estado.pop(atributo, None)
+        estado["_pool"] = None
+        estado["_pool_procesos"] = None
+        return estado
+
     def mostrar_resumen_limpieza(self, resultados: Dict[str, Any]) -> None:
         """
         Muestra un resumen detallado de los resultados del proceso de limpieza.
@@ -295,3 +730,63 @@ class DataCleaner:
             print(f"   {muestra}{'...' if len(tokens_finales) > 20 else ''}")
         
         print("Resumen de limpieza completado\n")
+
+
+# Instancia propia de cada proceso trabajador de proceso_limpieza_batch
+_limpiador_trabajador: Optional[DataCleaner] = None
+
+
+def _inicializar_trabajador(
+    idioma: str, palabras_vacias_extra: Tuple[str, ...]
+) -> None:
+    """
+    Crea el DataCleaner del proceso trabajador una sola vez.
+
+    Args:
+        idioma (str): Idioma de las stopwords
+        palabras_vacias_extra (Tuple[str, ...]): Stopwords adicionales del limpiador
+    """
+    global _limpiador_trabajador
+    _limpiador_trabajador = DataCleaner(
+        idioma=idioma, palabras_vacias_extra=palabras_vacias_extra
+    )
+
+
+def _limpiar_documento(
+    texto: str, incluir_normalizacion: bool, metodo_normalizacion: str
+) -> Dict[str, Any]:
+    """
+    Limpia un documento con el DataCleaner del proceso trabajador.
+
+    Args:
+        texto (str): Texto original
+        incluir_normalizacion (bool): Si aplicar normalización morfológica
+        metodo_normalizacion (str): Método de normalización a usar
+
+    Returns:
+        Dict[str, Any]: Resultado de proceso_limpieza_completa
+    """
+    assert _limpiador_trabajador is not None
+    return _limpiador_trabajador.proceso_limpieza_completa(
+        texto, incluir_normalizacion, metodo_normalizacion
+    )
+
+
+def _tokens_documento(
+    texto: str, incluir_normalizacion: bool, metodo_normalizacion: str
+) -> List[str]:
+    """
+    Obtiene los tokens finales de un documento con el DataCleaner del trabajador.
+
+    Args:
+        texto (str): Texto original
+        incluir_normalizacion (bool): Si aplicar normalización morfológica
+        metodo_normalizacion (str): Método de normalización a usar
+
+    Returns:
+        List[str]: Tokens finales del documento
+    """
+    assert _limpiador_trabajador is not None
+    return _limpiador_trabajador.obtener_tokens(
+        texto, incluir_normalizacion, metodo_normalizacion
+    )
@@ -4,9 +4,15 @@ Contiene clases y funciones para cargar y manipular corpus de texto.
 """
 
 from typing import Dict, List, Optional
+import importlib.util
 import pandas as pd
 from nltk.corpus import webtext
 
+# Columna de texto respaldada por Arrow (búfer contiguo) si pyarrow está instalado
+DTYPE_TEXTO: str = (
+    "string[pyarrow]" if importlib.util.find_spec("pyarrow") is not None else "str"
+)
+
 
 class GestorDatosTexto:
     """
@@ -18,6 +24,7 @@ class GestorDatosTexto:
         self.archivo_seleccionado: Optional[str] = None
         self.texto_crudo: Optional[str] = None
         self.dataframe_texto: Optional[pd.DataFrame] = None
+        self._conteo_palabras: Dict[str, int] = {}
 
     def explorar_archivos_disponibles(self) -> List[str]:
         """
@@ -31,11 +38,26 @@ class GestorDatosTexto:
         print("=" * 45)
 
         for i, archivo in enumerate(archivos, 1):
-            tamaño_palabras: int = len(self.corpus_webtext.words(archivo))
+            tamaño_palabras: int = self.contar_palabras_archivo(archivo)
             print(f"{i}. {archivo} ({tamaño_palabras:,} palabras)")
 
         return archivos
 
+    def contar_palabras_archivo(self, archivo: str) -> int:
+        """
+        Obtiene el número de palabras de un archivo del corpus, tokenizándolo
+        solo la primera vez que se consulta.
+
+        Args:
+            archivo (str): Nombre del archivo del corpus
+
+        Returns:
+            int: Número de palabras del archivo
+        """
+        if archivo not in self._conteo_palabras:
+            self._conteo_palabras[archivo] = len(self.corpus_webtext.words(archivo))
+        return self._conteo_palabras[archivo]
+
     def seleccionar_archivo(self, nombre_archivo: str) -> bool:
         """
         Selecciona un archivo específico del corpus para análisis.
@@ -70,20 +92,22 @@ class GestorDatosTexto:
             print("Primero debe seleccionar un archivo")
             return None
 
-        lineas: List[str] = self.texto_crudo.split("\n")
-        # Filtrar líneas vacías y muy cortas
+        # Filtrar líneas vacías y muy cortas (strip una sola vez por línea)
         lineas_filtradas: List[str] = [
-            linea.strip()
-            for linea in lineas
-            if linea.strip() and len(linea.strip()) > 3
+            linea
+            for linea in map(str.strip, self.texto_crudo.split("\n"))
+            if len(linea) > 3
         ]
 
+        # Columnas derivadas calculadas de forma vectorizada
         self.dataframe_texto = pd.DataFrame(
-            {
-                "texto": lineas_filtradas,
-                "longitud": [len(linea) for linea in lineas_filtradas],
-                "num_palabras": [len(linea.split()) for linea in lineas_filtradas],
-            }
+            {"texto": pd.Series(lineas_filtradas, dtype=DTYPE_TEXTO)}
+        )
+        self.dataframe_texto["longitud"] = (
+            self.dataframe_texto["texto"].str.len().astype("int64")
+        )
+        self.dataframe_texto["num_palabras"] = (
+            self.dataframe_texto["texto"].str.split().str.len().astype("int64")
         )
 
         return self.dataframe_texto
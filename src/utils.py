@@ -2,30 +2,35 @@
 Módulo de utilidades y funciones auxiliares para el proyecto de análisis de texto.
 """
 
-from typing import Dict, List, Any, Tuple
-import subprocess
-import sys
-import importlib
+from typing import Dict, List, Any, Optional, Tuple
+import importlib.util
 
 
 def verificar_e_instalar_dependencias() -> Dict[str, bool]:
     """
-    Verifica e instala las dependencias necesarias para el proyecto de NLP.
+    Verifica que las dependencias necesarias para el proyecto de NLP estén instaladas.
+
+    La comprobación usa importlib.util.find_spec, que localiza cada paquete sin
+    ejecutar su código de inicialización. No se instala nada automáticamente.
 
     Returns:
         Dict[str, bool]: Diccionario con el estado de instalación de cada paquete
+
+    Raises:
+        ImportError: Si falta alguno de los paquetes requeridos
     """
-    paquetes_requeridos: List[str] = [
-        "numpy",
-        "pandas",
-        "matplotlib",
-        "seaborn",
-        "nltk",
-        "wordcloud",
-        "textblob",
-        "spacy",
-        "scikit-learn",
-    ]
+    # Nombre del paquete en pip -> nombre del módulo importable
+    paquetes_requeridos: Dict[str, str] = {
+        "numpy": "numpy",
+        "pandas": "pandas",
+        "matplotlib": "matplotlib",
+        "seaborn": "seaborn",
+        "nltk": "nltk",
+        "wordcloud": "wordcloud",
+        "textblob": "textblob",
+        "spacy": "spacy",
+        "scikit-learn": "sklearn",
+    }
 
     estado_instalacion: Dict[str, bool] = {}
     paquetes_faltantes: List[str] = []
@@ -33,38 +38,23 @@ def verificar_e_instalar_dependencias() -> Dict[str, bool]:
     print("Verificando dependencias...")
     print("-" * 50)
 
-    for paquete in paquetes_requeridos:
-        try:
-            importlib.import_module(paquete)
+    for paquete, modulo in paquetes_requeridos.items():
+        if importlib.util.find_spec(modulo) is not None:
             print(f"✓ {paquete}: Instalado")
             estado_instalacion[paquete] = True
-        except ImportError:
+        else:
             print(f"✗ {paquete}: No encontrado")
             estado_instalacion[paquete] = False
             paquetes_faltantes.append(paquete)
 
+    print("\n" + "=" * 50)
+
     if paquetes_faltantes:
-        print(f"\nInstalando paquetes faltantes: {', '.join(paquetes_faltantes)}")
-        try:
-            subprocess.check_call(
-                [sys.executable, "-m", "pip", "install", *paquetes_faltantes, "--quiet"]
-            )
-            print("✓ Instalación completada exitosamente")
-
-            # Verificar nuevamente después de la instalación
-            for paquete in paquetes_faltantes:
-                try:
-                    importlib.import_module(paquete)
-                    estado_instalacion[paquete] = True
-                    print(f"✓ {paquete}: Ahora disponible")
-                except ImportError:
-                    estado_instalacion[paquete] = False
-                    print(f"✗ {paquete}: Error en la instalación")
-
-        except subprocess.CalledProcessError as e:
-            print(f"✗ Error durante la instalación: {e}")
+        raise ImportError(
+            "Faltan dependencias, instálelas con: pip install "
+            + " ".join(paquetes_faltantes)
+        )
 
-    print("\n" + "=" * 50)
     return estado_instalacion
 
 
@@ -77,27 +67,37 @@ def descargar_recursos_nltk() -> Dict[str, bool]:
     """
     import nltk
 
-    recursos_nltk: List[str] = [
-        "names",
-        "wordnet",
-        "webtext",
-        "stopwords",
-        "averaged_perceptron_tagger",
-        "punkt",
-        "opinion_lexicon",
-        "vader_lexicon",
-        "averaged_perceptron_tagger_eng",
-    ]
+    # Nombre del recurso -> ruta dentro de nltk_data usada para comprobar si existe
+    # (descomprimido o como .zip, según cómo lo haya dejado el descargador)
+    recursos_nltk: Dict[str, str] = {
+        "names": "corpora/names",
+        "wordnet": "corpora/wordnet",
+        "webtext": "corpora/webtext",
+        "stopwords": "corpora/stopwords",
+        "averaged_perceptron_tagger": "taggers/averaged_perceptron_tagger",
+        "punkt": "tokenizers/punkt",
+        "opinion_lexicon": "corpora/opinion_lexicon",
+        "vader_lexicon": "sentiment/vader_lexicon",
+        "averaged_perceptron_tagger_eng": "taggers/averaged_perceptron_tagger_eng",
+    }
 
     estado_descarga: Dict[str, bool] = {}
     print("Descargando recursos de NLTK...")
     print("-" * 40)
 
-    for recurso in recursos_nltk:
-        try:
-            nltk.download(recurso, quiet=True)
-            print(f"✓ {recurso}: Descargado")
+    for recurso, ruta in recursos_nltk.items():
+        # Evitar la consulta de red cuando el recurso ya está instalado
+        if _recurso_nltk_instalado(ruta):
+            print(f"✓ {recurso}: Disponible")
             estado_descarga[recurso] = True
+            continue
+
+        try:
+            estado_descarga[recurso] = bool(nltk.download(recurso, quiet=True))
+            if estado_descarga[recurso]:
+                print(f"✓ {recurso}: Descargado")
+            else:
+                print(f"✗ {recurso}: Error en la descarga")
         except Exception as e:
             print(f"✗ {recurso}: Error - {str(e)}")
             estado_descarga[recurso] = False
@@ -106,15 +106,49 @@ def descargar_recursos_nltk() -> Dict[str, bool]:
     return estado_descarga
 
 
+def _recurso_nltk_instalado(ruta: str) -> bool:
+    """
+    Comprueba localmente si un recurso de NLTK ya está instalado.
+
+    Args:
+        ruta (str): Ruta del recurso dentro de nltk_data, sin extensión
+
+    Returns:
+        bool: True si el recurso existe descomprimido o como archivo .zip
+    """
+    import nltk
+
+    for candidato in (ruta, f"{ruta}.zip"):
+        try:
+            nltk.data.find(candidato)
+            return True
+        except LookupError:
+            continue
+    return False
+
+
+# Último estado dibujado por mostrar_progreso: (mensaje, total, porcentaje entero)
+_ultimo_progreso: Optional[Tuple[str, int, int]] = None
+
+
 def mostrar_progreso(mensaje: str, progreso: int, total: int) -> None:
     """
-    Muestra una barra de progreso simple.
+    Muestra una barra de progreso simple, redibujada solo al cambiar el porcentaje.
 
     Args:
         mensaje (str): Mensaje a mostrar
         progreso (int): Progreso actual
         total (int): Total de elementos
     """
+    global _ultimo_progreso
+
+    # Como mucho un redibujado por cada punto porcentual entero, también
+    # cuando total < 100 o no es múltiplo de 100
+    estado: Tuple[str, int, int] = (mensaje, total, progreso * 100 // total)
+    if estado == _ultimo_progreso:
+        return
+    _ultimo_progreso = estado
+
     porcentaje: float = (progreso / total) * 100
     barra: str = "█" * int(porcentaje // 5) + "░" * (20 - int(porcentaje // 5))
     print(f"\r{mensaje}: [{barra}] {porcentaje:.1f}%", end="", flush=True)
@@ -144,7 +178,8 @@ def calcular_metricas_texto(tokens: List[str]) -> Dict[str, Any]:
     total_tokens: int = len(tokens)
     tokens_unicos: int = len(set(tokens))
     riqueza_lexica: float = tokens_unicos / total_tokens
-    longitud_promedio: float = sum(len(token) for token in tokens) / total_tokens
+    # map(len, ...) suma las longitudes en C, sin un generador en bytecode
+    longitud_promedio: float = sum(map(len, tokens)) / total_tokens
 
     return {
         "total_tokens": total_tokens,
@@ -2,9 +2,12 @@
 Pruebas unitarias para el módulo de limpieza de datos.
 """
 
+import importlib.util
+import pickle
 import unittest
 from typing import List
-from src.data_cleaning import LimpiadorAvanzadoTexto
+import pandas as pd
+from src.data_cleaning import DataCleaner
 
 
 class TestLimpiadorAvanzadoTexto(unittest.TestCase):
@@ -14,9 +17,13 @@ class TestLimpiadorAvanzadoTexto(unittest.TestCase):
 
     def setUp(self) -> None:
         """Configuración inicial para las pruebas."""
-        self.limpiador = LimpiadorAvanzadoTexto()
+        self.limpiador = DataCleaner()
         self.texto_prueba = "Hello! This is a TEST text with URLs http://example.com and emails test@example.com"
 
+    def tearDown(self) -> None:
+        """Cierra el pool de procesos que hayan abierto las pruebas."""
+        self.limpiador.close()
+
     def test_limpiar_nivel_basico(self) -> None:
         """Prueba la limpieza básica de texto."""
         resultado = self.limpiador.limpiar_nivel_basico(self.texto_prueba)
@@ -24,6 +31,34 @@ class TestLimpiadorAvanzadoTexto(unittest.TestCase):
         self.assertNotIn("http://", resultado)
         self.assertNotIn("@", resultado)
 
+    def test_limpiar(self) -> None:
+        """Prueba que la limpieza fusionada equivale a los niveles 1 y 2."""
+        resultado = self.limpiador.limpiar(self.texto_prueba)
+        esperado = self.limpiador.limpiar_nivel_intermedio(
+            self.limpiador.limpiar_nivel_basico(self.texto_prueba)
+        )
+        self.assertEqual(resultado, esperado)
+
+    def test_limpiar_serie(self) -> None:
+        """Prueba que limpiar_serie coincide con limpiar() en cada documento."""
+        textos = [self.texto_prueba, "I can't believe it's #done!!! @user"]
+        resultado = self.limpiador.limpiar_serie(pd.Series(textos))
+        esperado = [self.limpiador.limpiar(texto) for texto in textos]
+        self.assertEqual(resultado.tolist(), esperado)
+
+    def test_limpiar_serie_valores_faltantes(self) -> None:
+        """Prueba que limpiar_serie conserva los valores faltantes y el dtype."""
+        serie = pd.Series(["Hi THERE", None])
+        resultado = self.limpiador.limpiar_serie(serie)
+        self.assertEqual(resultado.iloc[0], "hi there")
+        self.assertTrue(pd.isna(resultado.iloc[1]))
+
+        serie_arrow = pd.Series(["Hi THERE", pd.NA], dtype="string[pyarrow]")
+        resultado_arrow = self.limpiador.limpiar_serie(serie_arrow)
+        self.assertEqual(resultado_arrow.dtype, serie_arrow.dtype)
+        self.assertEqual(resultado_arrow.iloc[0], "hi there")
+        self.assertTrue(pd.isna(resultado_arrow.iloc[1]))
+
     def test_tokenizar_y_filtrar(self) -> None:
         """Prueba la tokenización y filtrado."""
         texto_limpio = "this is a test text with some words"
@@ -32,6 +67,72 @@ class TestLimpiadorAvanzadoTexto(unittest.TestCase):
         self.assertTrue(all(isinstance(token, str) for token in tokens))
         self.assertTrue(all(len(token) > 2 for token in tokens))
 
+    def test_palabras_vacias_extra_palabras(self) -> None:
+        """Prueba que las palabras extra se suman a las stopwords del idioma."""
+        limpiador = DataCleaner(palabras_vacias_extra=["Firefox"])
+        self.assertIn("firefox", limpiador.palabras_vacias)
+        self.assertTrue(self.limpiador.palabras_vacias <= limpiador.palabras_vacias)
+        tokens = limpiador.tokenizar_y_filtrar("firefox browser crashes")
+        self.assertEqual(tokens, ["browser", "crashes"])
+
+    def test_palabras_vacias_extra_frases(self) -> None:
+        """Prueba que las frases extra solo se eliminan como frases completas."""
+        limpiador = DataCleaner(palabras_vacias_extra=["web  browser", "new tab"])
+        tokens = limpiador.tokenizar_y_filtrar(
+            "open new tab in web browser; web browsers newtab renew tabs"
+        )
+        self.assertEqual(
+            tokens, ["open", "web", "browsers", "newtab", "renew", "tabs"]
+        )
+
+    def test_palabras_vacias_extra_frases_mayusculas(self) -> None:
+        """Prueba que las frases se eliminan también en texto con mayúsculas."""
+        limpiador = DataCleaner(palabras_vacias_extra=["web browser"])
+        self.assertEqual(
+            limpiador._eliminar_frases_vacias("Open the Web  Browser now").split(),
+            ["Open", "the", "now"],
+        )
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("spacy")
+        and importlib.util.find_spec("en_core_web_sm"),
+        "requiere spaCy y el modelo en_core_web_sm",
+    )
+    def test_lematizar_con_spacy(self) -> None:
+        """Prueba la lematización con spaCy sobre texto con mayúsculas."""
+        (lemas,) = self.limpiador.lematizar_con_spacy(
+            [
+                "The striped Bats were hanging on their feet, see "
+                "https://example.com and HTTPS://Example.org/Page"
+            ]
+        )
+        self.assertIn("bat", lemas)
+        self.assertIn("hang", lemas)
+        self.assertIn("foot", lemas)
+        self.assertTrue(all(lema == lema.lower() for lema in lemas))
+        self.assertFalse(any("example" in lema for lema in lemas))
+        self.assertNotIn("page", lemas)
+
+    def test_palabras_vacias_extra_en_trabajadores(self) -> None:
+        """Prueba que los trabajadores del pool reciben las stopwords extra."""
+        with DataCleaner(palabras_vacias_extra=["firefox", "web browser"]) as limpiador:
+            vocabulario = limpiador.contar_vocabulario(
+                ["Firefox is my web browser of choice"] * 3,
+                incluir_normalizacion=False,
+                n_workers=2,
+            )
+        self.assertEqual(set(vocabulario), {"choice"})
+
+    def test_pickle_tras_normalizacion(self) -> None:
+        """Prueba que un limpiador ya usado se puede serializar con pickle."""
+        texto = self.limpiador.limpiar(self.texto_prueba)
+        tokens = self.limpiador.tokenizar_y_filtrar(texto)
+        esperado = self.limpiador.aplicar_normalizacion_morfologica(tokens)
+        self.limpiador.aplicar_normalizacion_morfologica(tokens, "stemming")
+
+        copia = pickle.loads(pickle.dumps(self.limpiador))
+        self.assertEqual(copia.aplicar_normalizacion_morfologica(tokens), esperado)
+
     def test_proceso_completo(self) -> None:
         """Prueba el proceso completo de limpieza."""
         resultado = self.limpiador.proceso_limpieza_completa(self.texto_prueba)
@@ -39,6 +140,58 @@ class TestLimpiadorAvanzadoTexto(unittest.TestCase):
         self.assertIn("limpieza_basica", resultado)
         self.assertIn("tokenizacion_filtrado", resultado)
 
+    def test_proceso_limpieza_batch(self) -> None:
+        """Prueba que el proceso en paralelo conserva orden y resultados."""
+        textos = [self.texto_prueba, "Another #sample text with @mentions", ""]
+        resultados = self.limpiador.proceso_limpieza_batch(
+            textos, n_workers=2, incluir_estadisticas=True
+        )
+        esperado = [self.limpiador.proceso_limpieza_completa(texto) for texto in textos]
+        self.assertEqual(resultados, esperado)
+
+    def test_obtener_tokens(self) -> None:
+        """Prueba que obtener_tokens coincide con los tokens del proceso completo."""
+        resultado = self.limpiador.obtener_tokens(self.texto_prueba)
+        esperado = self.limpiador.proceso_limpieza_completa(self.texto_prueba)
+        self.assertEqual(resultado, esperado["normalizacion_morfologica"]["tokens"])
+
+    def test_proceso_limpieza_batch_sin_estadisticas(self) -> None:
+        """Prueba que el proceso en paralelo sin estadísticas devuelve los tokens."""
+        textos = [self.texto_prueba, "Another #sample text with @mentions"]
+        resultados = self.limpiador.proceso_limpieza_batch(textos, n_workers=2)
+        esperado = [self.limpiador.obtener_tokens(texto) for texto in textos]
+        self.assertEqual(resultados, esperado)
+
+    def test_pool_reutilizado_entre_lotes(self) -> None:
+        """Prueba que varias llamadas por lotes comparten el mismo pool."""
+        self.limpiador.proceso_limpieza_batch([self.texto_prueba], n_workers=2)
+        pool = self.limpiador._pool
+        self.limpiador.contar_vocabulario([self.texto_prueba], n_workers=2)
+        self.assertIs(self.limpiador._pool, pool)
+        self.limpiador.close()
+        self.assertIsNone(self.limpiador._pool)
+
+    def test_pickle_con_pool_abierto(self) -> None:
+        """Prueba que el pool abierto no impide serializar el limpiador."""
+        self.limpiador.contar_vocabulario([self.texto_prueba], n_workers=2)
+        copia = pickle.loads(pickle.dumps(self.limpiador))
+        self.assertIsNone(copia._pool)
+        self.assertIsNotNone(self.limpiador._pool)
+
+    def test_contar_vocabulario(self) -> None:
+        """Prueba que el vocabulario agregado suma los tokens de cada documento."""
+        textos = [self.texto_prueba, self.texto_prueba, "Another sample text"]
+        vocabulario = self.limpiador.contar_vocabulario(textos, n_workers=2)
+        tokens = [
+            token
+            for texto in textos
+            for token in self.limpiador.proceso_limpieza_completa(texto)[
+                "normalizacion_morfologica"
+            ]["tokens"]
+        ]
+        self.assertEqual(sum(vocabulario.values()), len(tokens))
+        self.assertEqual(set(vocabulario), set(tokens))
+
 
 if __name__ == "__main__":
     unittest.main()